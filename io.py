@@ -1,5 +1,6 @@
 # Third-party
 import astropy.units as u
+import numpy as np
 
 
 def quantity_from_hdf5(dset):
@@ -18,12 +19,15 @@ def quantity_from_hdf5(dset):
         If a unit attribute exists, this returns a Quantity. Otherwise, it
         returns a numpy array.
     """
+    # read directly into a buffer with the stored shape and dtype, then
+    # attach the unit without making another copy
+    arr = np.empty(dset.shape, dtype=dset.dtype)
+    dset.read_direct(arr)
+
     if 'unit' in dset.attrs and dset.attrs['unit'] is not None:
-        unit = u.Unit(dset.attrs['unit'])
+        return arr << u.Unit(dset.attrs['unit'])
     else:
-        unit = 1.
-
-    return dset[:] * unit
+        return arr
 
 
 def quantity_to_hdf5(f, key, q):
@@ -1,4 +1,5 @@
 # Standard library
+import importlib
 import warnings
 
 # Third-party
@@ -6,13 +7,12 @@ from astropy import log as logger
 import astropy.coordinates as coord
 import astropy.units as u
 import numpy as np
-from scipy.signal import argrelmax
-from scipy.interpolate import InterpolatedUnivariateSpline
+from scipy.interpolate import (BSpline, InterpolatedUnivariateSpline,
+                               make_interp_spline)
 from scipy.optimize import minimize
 
 # Project
 from .core import PhaseSpacePosition
-from .util import peak_to_peak_period
 from .plot import plot_projections
 from ..io import quantity_to_hdf5, quantity_from_hdf5
 from ..util import atleast_2d
@@ -20,6 +20,157 @@ from ..units import dimensionless, UnitSystem, DimensionlessUnitSystem
 
 __all__ = ['Orbit']
 
+# frame classes loaded from HDF5 files, keyed by (module, class name)
+_frame_classes = dict()
+
+# set on first use: gala.potential imports this module, so this can't be
+# imported here
+_ConstantRotatingFrame = None
+
+# matplotlib.pyplot, set on first call to Orbit.plot()
+_plt = None
+
+
+def _bspline_eval_columns(spl, x, cols):
+    """
+    Evaluate a B-spline with 2D coefficients, shape ``(ncoeff, ncols)``, at
+    each ``x[i]`` using only the coefficients of column ``cols[i]``. This runs
+    de Boor's algorithm for all points at once.
+
+    Parameters
+    ----------
+    spl : :class:`scipy.interpolate.BSpline`
+    x : `numpy.ndarray`
+        Points to evaluate the spline at.
+    cols : `numpy.ndarray`
+        Integer column index for each point.
+    """
+    knots, c, k = spl.t, spl.c, spl.k
+    n = len(knots) - k - 1
+
+    # index of the knot interval containing each point
+    i = np.searchsorted(knots, x, side='right') - 1
+    i = np.clip(i, k, n - 1)
+
+    d = c[i[:, None] + np.arange(-k, 1), cols[:, None]]
+    for r in range(1, k + 1):
+        for j in range(k, r - 1, -1):
+            left = knots[i + j - k]
+            alpha = (x - left) / (knots[i + 1 + j - r] - left)
+            d[:, j] = (1 - alpha) * d[:, j - 1] + alpha * d[:, j]
+
+    return d[:, k]
+
+
+def _peak_to_peak_periods(t, f, amplitude_threshold=1E-2):
+    """
+    Estimate the period of each column of a 2D array of time series, shape
+    ``(ntimes, ncols)``, using peak-to-peak analysis. This is a vectorized
+    version of :func:`~gala.dynamics.util.peak_to_peak_period`.
+
+    Parameters
+    ----------
+    t : `numpy.ndarray`
+        Time grid aligned with the input time series.
+    f : `numpy.ndarray`
+        Periodic time series to analyze, one per column.
+    amplitude_threshold : numeric (optional)
+        Minimum mean amplitude of the oscillations.
+    """
+    ncols = f.shape[1]
+
+    means = []
+    periods = []
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # peaks, then troughs, excluding the edges
+        for cmp in (np.greater, np.less):
+            mask = cmp(f[1:-1], f[:-2]) & cmp(f[1:-1], f[2:])
+            col, ix = np.nonzero(mask.T)
+            ix = ix + 1
+            n = np.bincount(col, minlength=ncols)
+
+            means.append(np.bincount(col, weights=f[ix, col],
+                                     minlength=ncols) / n)
+
+            # the mean spacing between sorted peak times is
+            # (last - first) / (n - 1)
+            first = np.full(ncols, np.nan)
+            last = np.full(ncols, np.nan)
+            has = n > 0
+            start = np.cumsum(n) - n
+            first[has] = t[ix[start[has]]]
+            last[has] = t[ix[start[has] + n[has] - 1]]
+            periods.append((last - first) / (n - 1))
+
+        T = (periods[0] + periods[1]) / 2.
+
+        # neglect minor oscillations
+        T[np.abs(means[0] - means[1]) < amplitude_threshold] = np.nan
+
+    return T
+
+
+def _pack_galpy(cyl, ro, vo):
+    """
+    Build an array of galpy phase-space coordinates, in natural units and
+    with the coordinates ``[R, vR, vT, z, vz, phi]`` along the last axis.
+
+    Parameters
+    ----------
+    cyl : :class:`~gala.dynamics.PhaseSpacePosition`
+        Cylindrical phase-space positions.
+    ro : :class:`~astropy.units.Quantity`
+        "Natural" length unit.
+    vo : :class:`~astropy.units.Quantity`
+        "Natural" velocity unit.
+    """
+    rho = cyl.rho
+    pm_phi = cyl.pm_phi
+
+    # scale factors from the stored units to galpy's natural units, so
+    # that the unit conversions are single multiplications of raw arrays
+    s_rho = (1 * rho.unit / ro).to_value(u.one)
+    s_z = (1 * cyl.z.unit / ro).to_value(u.one)
+    s_phi = cyl.phi.unit.to(u.rad)
+    s_vR = (1 * cyl.v_rho.unit / vo).to_value(u.one)
+    # vT = rho * pm_phi: only the (scalar) unit product goes through the
+    # angle equivalency, the arrays are multiplied as plain floats
+    s_vT = (1 * rho.unit * pm_phi.unit / vo).to_value(
+        u.one, u.dimensionless_angles())
+    s_vz = (1 * cyl.v_z.unit / vo).to_value(u.one)
+
+    out = np.empty(rho.shape + (6,), dtype=float)
+
+    # each coordinate is written straight into its slot, without temporaries
+    np.multiply(rho.value, s_rho, out=out[..., 0])
+    np.multiply(cyl.v_rho.value, s_vR, out=out[..., 1])
+    np.multiply(rho.value, pm_phi.value, out=out[..., 2])
+    out[..., 2] *= s_vT
+    np.multiply(cyl.z.value, s_z, out=out[..., 3])
+    np.multiply(cyl.v_z.value, s_vz, out=out[..., 4])
+    np.multiply(cyl.phi.value, s_phi, out=out[..., 5])
+
+    return out
+
+
+def _galpy_ro_vo(ro=None, vo=None):
+    """
+    Fill in galpy's configured "natural" length and velocity units where
+    ``ro`` or ``vo`` is not specified.
+    """
+    from galpy.util.config import __config__ as galpy_config
+
+    # read on every call: galpy lets users change these at runtime
+    if ro is None:
+        ro = galpy_config.getfloat('normalization', 'ro')
+        ro = ro * u.kpc
+
+    if vo is None:
+        vo = galpy_config.getfloat('normalization', 'vo')
+        vo = vo * u.km/u.s
+
+    return ro, vo
+
 
 class Orbit(PhaseSpacePosition):
     """
@@ -103,6 +254,20 @@ class Orbit(PhaseSpacePosition):
 
     def __getitem__(self, slice_):
 
+        # fast paths for a single time, and a single orbit, e.g., [:, i]
+        if isinstance(slice_, (int, np.integer)):
+            return PhaseSpacePosition(pos=self.pos[slice_],
+                                      vel=self.vel[slice_],
+                                      frame=self.frame)
+
+        if (isinstance(slice_, tuple) and len(slice_) == 2 and
+                isinstance(slice_[1], (int, np.integer)) and
+                isinstance(slice_[0], slice) and slice_[0] == slice(None)):
+            return self._from_validated(self.pos[slice_], self.vel[slice_],
+                                        t=self.t, ndim=self.ndim,
+                                        potential=self.potential,
+                                        frame=self.frame)
+
         if isinstance(slice_, np.ndarray) or isinstance(slice_, list):
             slice_ = (slice_,)
 
@@ -132,6 +297,22 @@ class Orbit(PhaseSpacePosition):
                                   potential=self.potential,
                                   frame=self.frame, **kw)
 
+    @classmethod
+    def _from_validated(cls, pos, vel, t, ndim, potential=None, frame=None):
+        """
+        Create an orbit from position and velocity objects that are already
+        valid, e.g., derived from an existing ``Orbit``, skipping the input
+        checks done by the initializer.
+        """
+        obj = cls.__new__(cls)
+        obj.pos = pos
+        obj.vel = vel
+        obj.ndim = ndim
+        obj.t = t
+        obj.potential = potential
+        obj.frame = frame
+        return obj
+
     @property
     def hamiltonian(self):
         if self.potential is None or self.frame is None:
@@ -143,9 +324,33 @@ class Orbit(PhaseSpacePosition):
             from ..potential import Hamiltonian
             self._hamiltonian = Hamiltonian(potential=self.potential,
                                             frame=self.frame)
+            self._hamiltonian_units = self._hamiltonian.units
 
         return self._hamiltonian
 
+    @property
+    def _r_sph(self):
+        """Spherical radius, computed once and cached."""
+        try:
+            return self._physicsspherical_r
+        except AttributeError:
+            # only the positions are needed, so skip the full transformation
+            # of the phase-space coordinates
+            self._physicsspherical_r = self.pos.norm()
+
+        return self._physicsspherical_r
+
+    @property
+    def _z_cyl(self):
+        """Cylindrical z position, computed once and cached."""
+        try:
+            return self._cylindrical_z
+        except AttributeError:
+            self._cylindrical_z = self.pos.represent_as(
+                coord.CylindricalRepresentation).z
+
+        return self._cylindrical_z
+
     def w(self, units=None):
         """
         This returns a single array containing the phase-space positions.
@@ -165,10 +370,13 @@ class Orbit(PhaseSpacePosition):
         """
 
         if units is None:
-            if self.hamiltonian is None:
-                units = dimensionless
-            else:
-                units = self.hamiltonian.units
+            try:
+                units = self._hamiltonian_units
+            except AttributeError:
+                if self.hamiltonian is None:
+                    units = dimensionless
+                else:
+                    units = self._hamiltonian_units
 
         return super().w(units=units)
 
@@ -197,9 +405,9 @@ class Orbit(PhaseSpacePosition):
         """
 
         o = super().represent_as(new_pos=new_pos, new_vel=new_vel)
-        return self.__class__(pos=o.pos,
-                              vel=o.vel,
-                              hamiltonian=self.hamiltonian)
+        return self._from_validated(o.pos, o.vel, t=self.t, ndim=self.ndim,
+                                    potential=self.potential,
+                                    frame=self.frame)
 
     # ------------------------------------------------------------------------
     # Shape and size
@@ -257,7 +465,8 @@ class Orbit(PhaseSpacePosition):
         # TODO: this is duplicated code from PhaseSpacePosition
         if isinstance(f, str):
             import h5py
-            f = h5py.File(f, mode='r')
+            # larger chunk cache for reading long, chunked orbits
+            f = h5py.File(f, mode='r', rdcc_nbytes=64*1024*1024)
             close = True
         else:
             close = False
@@ -286,8 +495,11 @@ class Orbit(PhaseSpacePosition):
             for k in g['parameters']:
                 pars[k] = quantity_from_hdf5(g['parameters/'+k])
 
-            exec("from {0} import {1}".format(frame_mod, frame_cls))
-            frame_cls = eval(frame_cls)
+            key = (frame_mod, frame_cls)
+            if key not in _frame_classes:
+                mod = importlib.import_module(frame_mod)
+                _frame_classes[key] = getattr(mod, frame_cls)
+            frame_cls = _frame_classes[key]
 
             frame = frame_cls(units=units, **pars)
 
@@ -373,66 +585,198 @@ class Orbit(PhaseSpacePosition):
 
         return hamiltonian(self)
 
-    def _max_helper(self, arr, approximate=False,
-                    interp_kwargs=None, minimize_kwargs=None):
+    @staticmethod
+    def _max_helper_batch(t, arr, signs=(1,), approximate=False,
+                          interp_kwargs=None, minimize_kwargs=None):
         """
         Helper function for computing extrema (apocenter, pericenter, z_height)
-        and times of extrema.
+        and times of extrema for any number of orbits at once.
+
+        The maxima of ``sign * arr`` are found for each of ``signs``, reusing
+        the same interpolating spline, so ``signs=(1, -1)`` returns both the
+        maxima and the minima of ``arr``.
 
         Parameters
         ----------
-        arr : `numpy.ndarray`
-        """
-        assert self.norbits == 1
-        assert self.t[-1] > self.t[0]  # time must increase
+        t : `~astropy.units.Quantity`
+            Array of times, shape ``(ntimes,)``.
+        arr : `~astropy.units.Quantity`
+            Array to find the extrema of, shape ``(ntimes, norbits)``.
+        signs : iterable (optional)
+            Sign to apply to ``arr`` before finding the maxima.
 
-        _ix = argrelmax(arr.value, mode='wrap')[0]
-        _ix = _ix[(_ix != 0) & (_ix != (len(arr)-1))]  # remove edges
-        t = self.t.value
-
-        approx_arr = arr[_ix]
-        approx_t = t[_ix]
+        Returns
+        -------
+        extrema : list
+            For each sign, a tuple ``(vals, times)`` of lists with the values
+            of ``arr`` at the maxima of ``sign * arr`` and the times of the
+            maxima for each orbit.
+        """
+        assert t[-1] > t[0]  # time must increase
+
+        t_unit = t.unit
+        arr_unit = arr.unit
+        t = t.value
+        arr = arr.value.reshape(len(t), -1)
+        norbits = arr.shape[1]
+
+        candidates = []
+        for sign in signs:
+            # local maxima of all orbits in a single pass, excluding the edges;
+            # transposed so that the indices are grouped by orbit
+            sarr = sign * arr
+            mask = (sarr[1:-1] > sarr[:-2]) & (sarr[1:-1] > sarr[2:])
+            orbit_ix, ix_all = np.nonzero(mask.T)
+            ix_all = ix_all + 1
+            splits = np.cumsum(np.bincount(orbit_ix, minlength=norbits))[:-1]
+            candidates.append((orbit_ix, ix_all, splits))
 
         if approximate:
-            return approx_arr, approx_t * self.t.unit
+            extrema = []
+            for sign, (orbit_ix, ix_all, splits) in zip(signs, candidates):
+                vals = np.split(arr[ix_all, orbit_ix], splits)
+                times = np.split(t[ix_all], splits)
+                extrema.append(([v * arr_unit for v in vals],
+                                [x * t_unit for x in times]))
+            return extrema
 
         if interp_kwargs is None:
             interp_kwargs = dict()
 
+        # the minimizer is used whenever minimize_kwargs is specified, even
+        # if it is empty
+        use_minimize = minimize_kwargs is not None
         if minimize_kwargs is None:
             minimize_kwargs = dict()
 
         # default scipy function kwargs
         interp_kwargs.setdefault('k', 3)
         interp_kwargs.setdefault('ext', 3)  # don't extrapolate, use boundary
-        minimize_kwargs.setdefault('method', 'powell')
 
-        # Interpolating function to upsample array:
-        # Negative sign because we assume we're always finding the maxima
-        interp_func = InterpolatedUnivariateSpline(t, -arr.value,
-                                                   **interp_kwargs)
+        # A single interpolating spline, with one column of coefficients per
+        # orbit, to upsample the arrays of all orbits; shared by all signs
+        k = interp_kwargs['k']
+        if set(interp_kwargs) <= {'k', 'ext'} and interp_kwargs['ext'] == 3:
+            spl = make_interp_spline(t, arr, k=k, axis=0)
+
+            # per-orbit functions for the minimizer, using the boundary values
+            # outside of the time range like ext=3
+            interp_funcs = [
+                lambda x, c=BSpline(spl.t, spl.c[:, n], k): c(
+                    np.clip(x, t[0], t[-1]))
+                for n in range(norbits)]
 
-        better_times = np.zeros(_ix.shape, dtype=float)
-        for i, j in enumerate(_ix):
-            res = minimize(interp_func, t[j], **minimize_kwargs)
-            better_times[i] = res.x
+        else:
+            # other options are only supported by the FITPACK splines: these
+            # share knots, so their coefficients can still be stacked
+            interp_funcs = [InterpolatedUnivariateSpline(t, arr[:, n],
+                                                         **interp_kwargs)
+                            for n in range(norbits)]
+            knots = interp_funcs[0].get_knots()
+            knots = np.concatenate((np.full(k, knots[0]), knots,
+                                    np.full(k, knots[-1])))
+            coeffs = np.stack([func.get_coeffs() for func in interp_funcs],
+                              axis=1)
+            spl = BSpline(knots, coeffs, k)
+
+        use_minimize = use_minimize or k < 2
+        if use_minimize:
+            minimize_kwargs.setdefault('method', 'powell')
 
-        better_arr = -interp_func(better_times)
-        return better_arr * arr.unit, better_times * self.t.unit
+        else:
+            d1 = spl.derivative(1)
+            d2 = spl.derivative(2)
+
+        extrema = []
+        for sign, (orbit_ix, ix_all, splits) in zip(signs, candidates):
+            better_times = t[ix_all]
+
+            if use_minimize:
+                # fall back to a general-purpose minimizer per extremum
+                better_times = np.split(better_times, splits)
+                for func, x in zip(interp_funcs, better_times):
+                    for i in range(len(x)):
+                        res = minimize(lambda y: -sign * func(y), x[i],
+                                       **minimize_kwargs)
+                        x[i] = np.ravel(res.x)[0]
+                better_times = np.concatenate(better_times)
 
-    def _max_return_helper(self, vals, times, return_times, reduce):
+            else:
+                # Newton iterations on the spline derivatives, all extrema of
+                # all orbits at once, keeping each root within the bracketing
+                # timesteps. The step does not depend on the sign.
+                lo = t[ix_all - 1]
+                hi = t[ix_all + 1]
+                for _ in range(3):
+                    num = _bspline_eval_columns(d1, better_times, orbit_ix)
+                    den = _bspline_eval_columns(d2, better_times, orbit_ix)
+                    step = np.divide(num, den, out=np.zeros_like(num),
+                                     where=den != 0)
+                    better_times = np.clip(better_times - step, lo, hi)
+
+            # values at the extrema of all orbits at once; clipping to the
+            # time range matches the splines' boundary extrapolation (ext=3)
+            better_arr = _bspline_eval_columns(
+                spl, np.clip(better_times, t[0], t[-1]), orbit_ix)
+
+            vals = [v * arr_unit for v in np.split(better_arr, splits)]
+            times = [x * t_unit for x in np.split(better_times, splits)]
+            extrema.append((vals, times))
+
+        return extrema
+
+    def _max_return_helper(self, vals, times, return_times, func):
         if return_times:
             if len(vals) == 1:
                 return vals[0], times[0]
             else:
                 return vals, times
 
-        elif reduce:
-            return u.Quantity(vals).reshape(self.shape[1:])
+        elif func is not None:
+            first = func(vals[0])
+            if not isinstance(first, u.Quantity):
+                # e.g., func=len
+                return u.Quantity(
+                    [first] + [func(v) for v in vals[1:]]
+                ).reshape(self.shape[1:])
+
+            # reduce each orbit into a preallocated array of known unit
+            unit = first.unit
+            reduced = np.empty(len(vals))
+            reduced[0] = first.value
+            for i in range(1, len(vals)):
+                reduced[i] = func(vals[i]).to_value(unit)
+            return (reduced * unit).reshape(self.shape[1:])
 
         else:
             return u.Quantity(vals)
 
+    def _radial_extrema(self, signs, return_times=False, func=np.mean,
+                        interp_kwargs=None, minimize_kwargs=None,
+                        approximate=False):
+        """
+        Helper function for apocenters (``sign=1``) and pericenters
+        (``sign=-1``) that builds the interpolating spline of the spherical
+        radius only once for all of ``signs``. Returns a list with one result,
+        as returned by ``apocenter()`` or ``pericenter()``, per sign.
+        """
+
+        # time must increase: reverse views of the arrays, if needed, instead
+        # of creating a reversed Orbit
+        t = self.t
+        r = self._r_sph
+        if t.value[-1] < t.value[0]:
+            t = t[::-1]
+            r = r[::-1]
+
+        extrema = self._max_helper_batch(t, r, signs=signs,
+                                         interp_kwargs=interp_kwargs,
+                                         minimize_kwargs=minimize_kwargs,
+                                         approximate=approximate)
+
+        return [self._max_return_helper(vals, times, return_times, func)
+                for vals, times in extrema]
+
     def pericenter(self, return_times=False, func=np.mean,
                    interp_kwargs=None, minimize_kwargs=None,
                    approximate=False):
@@ -456,6 +800,8 @@ class Orbit(PhaseSpacePosition):
             :class:`scipy.interpolate.InterpolatedUnivariateSpline`.
         minimize_kwargs : dict (optional)
             Keyword arguments to be passed to :class:`scipy.optimize.minimize`.
+            If specified, the minimizer is used to refine each extremum instead
+            of Newton iterations on the interpolating spline.
         approximate : bool (optional)
             Compute an approximate pericenter by skipping interpolation.
 
@@ -475,27 +821,12 @@ class Orbit(PhaseSpacePosition):
                              "you want to return all individual pericenters "
                              "and times.")
 
-        if func is None:
-            reduce = False
-            func = lambda x: x  # noqa
-        else:
-            reduce = True
-
-        # time must increase
-        if self.t[-1] < self.t[0]:
-            self = self[::-1]
-
-        vals = []
-        times = []
-        for orbit in self.orbit_gen():
-            v, t = orbit._max_helper(-orbit.physicsspherical.r,  # pericenter
-                                     interp_kwargs=interp_kwargs,
+        # negative sign to find minima for pericenter
+        peri, = self._radial_extrema((-1,), return_times=return_times,
+                                     func=func, interp_kwargs=interp_kwargs,
                                      minimize_kwargs=minimize_kwargs,
                                      approximate=approximate)
-            vals.append(func(-v))  # negative for pericenter
-            times.append(t)
-
-        return self._max_return_helper(vals, times, return_times, reduce)
+        return peri
 
     def apocenter(self, return_times=False, func=np.mean,
                   interp_kwargs=None, minimize_kwargs=None,
@@ -520,6 +851,8 @@ class Orbit(PhaseSpacePosition):
             :class:`scipy.interpolate.InterpolatedUnivariateSpline`.
         minimize_kwargs : dict (optional)
             Keyword arguments to be passed to :class:`scipy.optimize.minimize`.
+            If specified, the minimizer is used to refine each extremum instead
+            of Newton iterations on the interpolating spline.
         approximate : bool (optional)
             Compute an approximate apocenter by skipping interpolation.
 
@@ -539,27 +872,11 @@ class Orbit(PhaseSpacePosition):
                              "you want to return all individual apocenters "
                              "and times.")
 
-        if func is None:
-            reduce = False
-            func = lambda x: x  # noqa
-        else:
-            reduce = True
-
-        # time must increase
-        if self.t[-1] < self.t[0]:
-            self = self[::-1]
-
-        vals = []
-        times = []
-        for orbit in self.orbit_gen():
-            v, t = orbit._max_helper(orbit.physicsspherical.r,  # apocenter
-                                     interp_kwargs=interp_kwargs,
-                                     minimize_kwargs=minimize_kwargs,
-                                     approximate=approximate)
-            vals.append(func(v))
-            times.append(t)
-
-        return self._max_return_helper(vals, times, return_times, reduce)
+        apo, = self._radial_extrema((1,), return_times=return_times,
+                                    func=func, interp_kwargs=interp_kwargs,
+                                    minimize_kwargs=minimize_kwargs,
+                                    approximate=approximate)
+        return apo
 
     def zmax(self, return_times=False, func=np.mean,
              interp_kwargs=None, minimize_kwargs=None,
@@ -584,6 +901,8 @@ class Orbit(PhaseSpacePosition):
             :class:`scipy.interpolate.InterpolatedUnivariateSpline`.
         minimize_kwargs : dict (optional)
             Keyword arguments to be passed to :class:`scipy.optimize.minimize`.
+            If specified, the minimizer is used to refine each extremum instead
+            of Newton iterations on the interpolating spline.
         approximate : bool (optional)
             Compute approximate values by skipping interpolation.
 
@@ -603,27 +922,19 @@ class Orbit(PhaseSpacePosition):
                              "you want to return all individual values "
                              "and times.")
 
-        if func is None:
-            reduce = False
-            func = lambda x: x  # noqa
-        else:
-            reduce = True
+        # time must increase: reverse views of the arrays, if needed, instead
+        # of creating a reversed Orbit
+        t = self.t
+        z = self._z_cyl
+        if t.value[-1] < t.value[0]:
+            t = t[::-1]
+            z = z[::-1]
 
-        # time must increase
-        if self.t[-1] < self.t[0]:
-            self = self[::-1]
+        (vals, times), = self._max_helper_batch(
+            t, np.abs(z), interp_kwargs=interp_kwargs,
+            minimize_kwargs=minimize_kwargs, approximate=approximate)
 
-        vals = []
-        times = []
-        for orbit in self.orbit_gen():
-            v, t = orbit._max_helper(np.abs(orbit.cylindrical.z),
-                                     interp_kwargs=interp_kwargs,
-                                     minimize_kwargs=minimize_kwargs,
-                                     approximate=approximate)
-            vals.append(func(v))
-            times.append(t)
-
-        return self._max_return_helper(vals, times, return_times, reduce)
+        return self._max_return_helper(vals, times, return_times, func)
 
     def eccentricity(self, **kw):
         r"""
@@ -646,8 +957,12 @@ class Orbit(PhaseSpacePosition):
             The orbital eccentricity.
 
         """
-        ra = self.apocenter(**kw)
-        rp = self.pericenter(**kw)
+        if kw.get('return_times', False):
+            raise ValueError("Cannot return times when computing the "
+                             "eccentricity.")
+
+        # apocenters and pericenters from the same interpolating spline
+        ra, rp = self._radial_extrema((1, -1), **kw)
         return (ra - rp) / (ra + rp)
 
     def estimate_period(self, radial=True):
@@ -674,12 +989,10 @@ class Orbit(PhaseSpacePosition):
                              "Specify a time array when creating this object.")
 
         if radial:
-            r = self.physicsspherical.r.value
+            r = self._r_sph.value.reshape(self.ntimes, -1)
+            T = _peak_to_peak_periods(self.t.value, r) * self.t.unit
             if self.norbits == 1:
-                T = u.Quantity(peak_to_peak_period(self.t, r))
-            else:
-                T = u.Quantity([peak_to_peak_period(self.t, r[:, n])
-                                for n in range(r.shape[1])])
+                T = T[0]
 
         else:
             raise NotImplementedError("sorry 'bout that...")
@@ -724,19 +1037,24 @@ class Orbit(PhaseSpacePosition):
             single_orbit = False
 
         ndim, ntimes, norbits = L.shape
+        L = L.value
+
+        # see if at any timestep the sign has changed relative to the initial
+        # angular momentum, for all axes and orbits at once. Comparing sign
+        # bits keeps the intermediate arrays boolean; an initial value of
+        # exactly zero or NaN, and any later NaN, counts as a change, as with
+        # np.sign()
+        signbit = np.signbit(L)
+        cnd = ((signbit[:, :1] != signbit[:, 1:]) |
+               ~(np.abs(L[:, 1:]) >= 1E-13))
+        changed = np.empty((ndim, norbits), dtype=bool)
+        np.any(cnd, axis=1, out=changed)
+        if ntimes > 1:
+            changed |= (L[:, 0] == 0) | np.isnan(L[:, 0])
+
+        circ = np.ones((ndim, norbits), dtype=np.int8)
+        circ[changed] = 0
 
-        # initial angular momentum
-        L0 = L[:, 0]
-
-        # see if at any timestep the sign has changed
-        circ = np.ones((ndim, norbits))
-        for ii in range(ndim):
-            cnd = (np.sign(L0[ii]) != np.sign(L[ii, 1:])) | \
-                  (np.abs(L[ii, 1:]).value < 1E-13)
-            ix = np.atleast_1d(np.any(cnd, axis=0))
-            circ[ii, ix] = 0
-
-        circ = circ.astype(int)
         if single_orbit:
             return circ.reshape((ndim,))
         else:
@@ -768,9 +1086,7 @@ class Orbit(PhaseSpacePosition):
 
         cart = self.cartesian
         pos = cart.xyz
-        vel = np.vstack((cart.v_x.value[None],
-                         cart.v_y.value[None],
-                         cart.v_z.value[None])) * cart.v_x.unit
+        vel = cart.vel.d_xyz
 
         if pos.ndim < 3:
             pos = pos[..., np.newaxis]
@@ -782,29 +1098,39 @@ class Orbit(PhaseSpacePosition):
                              "shape of the position/velocity (minus the time "
                              "axis).")
 
-        new_pos = pos.copy()
-        new_vel = vel.copy()
-        for n in range(pos.shape[2]):
-            if circulation[2, n] == 1 or np.all(circulation[:, n] == 0):
-                # already circulating about z or box orbit
-                continue
-
-            if sum(circulation[:, n]) > 1:
-                logger.warning("Circulation about multiple axes - are you sure "
-                               "the orbit has been integrated for long enough?")
-
-            if circulation[0, n] == 1:
-                circ = 0
-            elif circulation[1, n] == 1:
-                circ = 1
-            else:
-                raise RuntimeError("Should never get here...")
-
-            new_pos[circ, :, n] = pos[2, :, n]
-            new_pos[2, :, n] = pos[circ, :, n]
+        # already circulating about z or box orbit
+        skip = (circulation[2] == 1) | np.all(circulation == 0, axis=0)
+
+        if np.any(circulation[:, ~skip].sum(axis=0) > 1):
+            logger.warning("Circulation about multiple axes - are you sure "
+                           "the orbit has been integrated for long enough?")
+
+        swap_x = ~skip & (circulation[0] == 1)
+        swap_y = ~skip & ~swap_x & (circulation[1] == 1)
+
+        # per-orbit permutation of the coordinate axes
+        perm = np.broadcast_to(np.arange(pos.shape[0])[:, None],
+                               (pos.shape[0], pos.shape[2])).copy()
+        perm[0, swap_x] = 2
+        perm[2, swap_x] = 0
+        perm[1, swap_y] = 2
+        perm[2, swap_y] = 1
+
+        # only orbits that need an axis swap are copied and permuted; the
+        # output Orbit makes its own copy of the data anyways
+        swap = swap_x | swap_y
+        if swap.any():
+            new_pos = pos.copy()
+            new_vel = vel.copy()
+            perm = perm[:, None, swap]
+            new_pos[..., swap] = np.take_along_axis(pos[..., swap], perm,
+                                                    axis=0)
+            new_vel[..., swap] = np.take_along_axis(vel[..., swap], perm,
+                                                    axis=0)
 
-            new_vel[circ, :, n] = vel[2, :, n]
-            new_vel[2, :, n] = vel[circ, :, n]
+        else:
+            new_pos = pos
+            new_vel = vel
 
         return self.__class__(pos=new_pos.reshape(cart.xyz.shape),
                               vel=new_vel.reshape(cart.xyz.shape),
@@ -858,17 +1184,23 @@ class Orbit(PhaseSpacePosition):
 
         """
 
-        try:
-            import matplotlib.pyplot as plt
-        except ImportError:
-            msg = 'matplotlib is required for visualization.'
-            raise ImportError(msg)
+        global _plt
+        if _plt is None:
+            try:
+                import matplotlib.pyplot as _plt
+            except ImportError:
+                msg = 'matplotlib is required for visualization.'
+                raise ImportError(msg)
+
+        pos = self.pos
+        pos_name = pos.get_name()
+        pos_components = pos.components
 
         if components is None:
             if self.ndim == 1:  # only a 1D orbit, so just plot time series
-                components = ['t', self.pos.components[0]]
+                components = ['t', pos_components[0]]
             else:
-                components = self.pos.components
+                components = pos_components
 
         x, labels = self._plot_prepare(components=components,
                                        units=units)
@@ -877,20 +1209,18 @@ class Orbit(PhaseSpacePosition):
             'marker': '',
             'linestyle': '-',
             'labels': labels,
-            'plot_function': plt.plot
+            'plot_function': _plt.plot
         }
 
-        for k, v in default_kwargs.items():
-            kwargs[k] = kwargs.get(k, v)
+        kwargs = {**default_kwargs, **kwargs}
 
         fig = plot_projections(x, **kwargs)
 
-        if self.pos.get_name() == 'cartesian' and \
+        if pos_name == 'cartesian' and \
                 all([not c.startswith('d_') for c in components]) and \
                 't' not in components and \
                 auto_aspect:
-            for ax in fig.axes:
-                ax.set(aspect='equal', adjustable='datalim')
+            _plt.setp(fig.axes, aspect='equal', adjustable='datalim')
 
         return fig
 
@@ -918,15 +1248,19 @@ class Orbit(PhaseSpacePosition):
         # TODO: this short-circuit sux
         if current_frame is None:
             current_frame = self.frame
-        if frame == current_frame and not kwargs:
+        # transforming to the same frame is a no-op, even if times are passed
+        if frame == current_frame and set(kwargs) <= {'t'}:
             return self
 
         # TODO: need a better way to do this!
-        from ..potential.frame.builtin import ConstantRotatingFrame
-        for fr in [frame, current_frame, self.frame]:
-            if isinstance(fr, ConstantRotatingFrame):
-                if 't' not in kw:
-                    kw['t'] = self.t
+        global _ConstantRotatingFrame
+        if _ConstantRotatingFrame is None:
+            from ..potential.frame.builtin import (
+                ConstantRotatingFrame as _ConstantRotatingFrame)
+
+        if 't' not in kw and any(isinstance(fr, _ConstantRotatingFrame)
+                                 for fr in (frame, current_frame, self.frame)):
+            kw['t'] = self.t
 
         # TODO: this needs a re-write...
         psp = super().to_frame(frame, current_frame, **kw)
@@ -954,38 +1288,88 @@ class Orbit(PhaseSpacePosition):
 
         """
         from galpy.orbit import Orbit
-        from galpy.util.config import __config__ as galpy_config
 
-        if self.frame is not None:
-            from ..potential import StaticFrame
-            w = self.to_frame(StaticFrame(self.frame.units))
+        w = self._to_galpy_frame()
+        ro, vo = _galpy_ro_vo(ro, vo)
+
+        # PhaseSpacePosition or Orbit:
+        if (w.pos.get_name() == 'cylindrical' and
+                w.vel.get_name() == 'cylindrical'):
+            cyl = w  # no need to convert the representation
         else:
-            w = self
+            cyl = w.cylindrical
+        arr = _pack_galpy(cyl, ro, vo)
 
-        if ro is None:
-            ro = galpy_config.getfloat('normalization', 'ro')
-            ro = ro * u.kpc
+        o = Orbit(arr, ro=ro, vo=vo)
+        if w.t is not None:
+            o.t = w.t.to_value(ro / vo)
 
-        if vo is None:
-            vo = galpy_config.getfloat('normalization', 'vo')
-            vo = vo * u.km/u.s
+        return o
 
-        # PhaseSpacePosition or Orbit:
-        cyl = w.cylindrical
+    @classmethod
+    def to_galpy_orbits(cls, orbits, ro=None, vo=None):
+        """Convert a sequence of orbits to ``galpy.Orbit`` instances. The
+        representation and unit conversions are done once for all orbits.
+
+        Parameters
+        ----------
+        orbits : iterable
+            :class:`~gala.dynamics.Orbit` instances, which must all have the
+            same shape.
+        ro : `astropy.units.Quantity` or `astropy.units.UnitBase`
+            "Natural" length unit.
+        vo : `astropy.units.Quantity` or `astropy.units.UnitBase`
+            "Natural" velocity unit.
 
-        R = cyl.rho.to_value(ro).T
-        phi = cyl.phi.to_value(u.rad).T
-        z = cyl.z.to_value(ro).T
+        Returns
+        -------
+        galpy_orbits : list
+            A `galpy.orbit.Orbit` for each input orbit.
 
-        vR = cyl.v_rho.to_value(vo).T
-        vT = (cyl.rho * cyl.pm_phi).to_value(vo, u.dimensionless_angles()).T
-        vz = cyl.v_z.to_value(vo).T
+        """
+        from galpy.orbit import Orbit
 
-        o = Orbit(np.array([R, vR, vT, z, vz, phi]).T, ro=ro, vo=vo)
-        if w.t is not None:
-            o.t = w.t.to_value(ro / vo)
+        ws = [orbit._to_galpy_frame() for orbit in orbits]
+        if not ws:
+            return []
+
+        if any(w.shape != ws[0].shape for w in ws):
+            raise ValueError("All orbits must have the same shape.")
+
+        ro, vo = _galpy_ro_vo(ro, vo)
+
+        # stack the Cartesian positions and velocities of all orbits along a
+        # new leading axis, so they are converted to galpy coordinates at once
+        carts = [w.cartesian for w in ws]
+        pos_unit = carts[0].pos.xyz.unit
+        vel_unit = carts[0].vel.d_xyz.unit
+        xyz = np.stack([c.pos.xyz.to_value(pos_unit) for c in carts], axis=1)
+        d_xyz = np.stack([c.vel.d_xyz.to_value(vel_unit) for c in carts],
+                         axis=1)
+        stacked = PhaseSpacePosition(
+            pos=coord.CartesianRepresentation(xyz * pos_unit, copy=False),
+            vel=coord.CartesianDifferential(d_xyz * vel_unit, copy=False))
+        arr = _pack_galpy(stacked.cylindrical, ro, vo)
+
+        galpy_orbits = []
+        for w, w_arr in zip(ws, arr):
+            o = Orbit(w_arr, ro=ro, vo=vo)
+            if w.t is not None:
+                o.t = w.t.to_value(ro / vo)
+            galpy_orbits.append(o)
+
+        return galpy_orbits
+
+    def _to_galpy_frame(self):
+        """
+        Galpy orbits are in a static frame: transform to one if necessary.
+        """
+        from ..potential import StaticFrame
 
-        return o
+        if (self.frame is not None and
+                not isinstance(self.frame, StaticFrame)):
+            return self.to_frame(StaticFrame(self.frame.units))
+        return self
 
     @classmethod
     def from_galpy_orbit(self, galpy_orbit):
@@ -1001,21 +1385,32 @@ class Orbit(PhaseSpacePosition):
         orbit : :class:`~gala.dynamics.Orbit`
 
         """
-        ro = galpy_orbit._ro * u.kpc
-        vo = galpy_orbit._vo * u.km/u.s
-        ts = galpy_orbit.t
-
+        # galpy's "natural" units, in kpc and km/s
+        ro = galpy_orbit._ro
+        vo = galpy_orbit._vo
+        vel_unit = u.km/u.s
+
+        # the integrated orbit at galpy_orbit.t, in natural units, with
+        # columns [R, vR, vT, z, vz, phi] -- avoids evaluating each of the
+        # coordinate accessors separately
+        orb = galpy_orbit.getOrbit()
+        R = orb[..., 0]
+
+        # scale the raw arrays, then attach the units without another copy
         rep = coord.CylindricalRepresentation(
-            rho=galpy_orbit.R(ts) * ro,
-            phi=galpy_orbit.phi(ts) * u.rad,
-            z=galpy_orbit.z(ts) * ro
+            rho=u.Quantity(R * ro, u.kpc, copy=False),
+            phi=u.Quantity(orb[..., 5], u.rad, copy=False),
+            z=u.Quantity(orb[..., 3] * ro, u.kpc, copy=False),
+            copy=False
+        )
+        # vT / R in natural units, so the angular velocity is in rad * vo / ro
+        dif = coord.CylindricalDifferential(
+            d_rho=u.Quantity(orb[..., 1] * vo, vel_unit, copy=False),
+            d_phi=u.Quantity(orb[..., 2] / R * (vo / ro),
+                             u.rad * vel_unit / u.kpc, copy=False),
+            d_z=u.Quantity(orb[..., 4] * vo, vel_unit, copy=False),
+            copy=False
         )
-        with u.set_enabled_equivalencies(u.dimensionless_angles()):
-            dif = coord.CylindricalDifferential(
-                d_rho=galpy_orbit.vR(ts) * vo,
-                d_phi=galpy_orbit.vT(ts) * vo / rep.rho,
-                d_z=galpy_orbit.vz(ts) * vo
-            )
-
-        t = galpy_orbit.t * ro / vo
+
+        t = u.Quantity(galpy_orbit.t * ro / vo, u.kpc / vel_unit, copy=False)
         return Orbit(rep, dif, t=t)